@@ -6,6 +6,7 @@ import math
 import typing as ty
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from random import SystemRandom
 
 # ==============================================================================
@@ -16,6 +17,8 @@ from random import SystemRandom
 class Vector3D:
     """Represents a vector in 3D space."""
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float) -> None:
         """Initialize a new vector.
 
@@ -46,7 +49,7 @@ class Vector3D:
         :return: The length of this vector.
         :rtype: float
         """
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        return math.hypot(self.x, self.y, self.z)
 
     def normalize(self) -> "Vector3D":
         """Normalize this vector.
@@ -54,9 +57,10 @@ class Vector3D:
         :return: A new vector with the same direction as this vector but with unit length.
         :rtype: Vector3D
         """
-        if self.length() == 0:  # Prevent division by zero.
+        length = self.length()
+        if length == 0:  # Prevent division by zero.
             return Vector3D(0, 0, 0)
-        return self.multiply(1 / self.length())
+        return Vector3D(self.x / length, self.y / length, self.z / length)
 
     def dot(self, other: "Vector3D") -> float:
         """Calculate the dot product of this vector with another vector.
@@ -106,6 +110,8 @@ class Vector3D:
 class Point2D:
     """Represents a point in 2D space."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float) -> None:
         """Initialize a new point.
 
@@ -141,6 +147,8 @@ class Point2D:
 class Point3D:
     """Represents a point in 3D space."""
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float) -> None:
         """Initialize a new point.
 
@@ -173,7 +181,7 @@ class Point3D:
         :return: The distance between this point and another point.
         :rtype: float
         """
-        return self.create_vector(other).length()
+        return math.dist((self.x, self.y, self.z), (other.x, other.y, other.z))
 
     def midpoint(self, other: "Point3D") -> "Point3D":
         """Calculate the midpoint between this point and another point.
@@ -209,17 +217,21 @@ class Point3D:
 
         Note x, y, z and in radians.
         """
+        cos_x, sin_x = math.cos(x), math.sin(x)
+        cos_y, sin_y = math.cos(y), math.sin(y)
+        cos_z, sin_z = math.cos(z), math.sin(z)
+
         # Rotate around x-axis.
-        y1 = self.y * math.cos(x) - self.z * math.sin(x)
-        z1 = self.y * math.sin(x) + self.z * math.cos(x)
+        y1 = self.y * cos_x - self.z * sin_x
+        z1 = self.y * sin_x + self.z * cos_x
 
         # Rotate around y-axis.
-        x2 = self.x * math.cos(y) + z1 * math.sin(y)
-        z2 = -self.x * math.sin(y) + z1 * math.cos(y)
+        x2 = self.x * cos_y + z1 * sin_y
+        z2 = -self.x * sin_y + z1 * cos_y
 
         # Rotate around z-axis.
-        x3 = x2 * math.cos(z) - y1 * math.sin(z)
-        y3 = x2 * math.sin(z) + y1 * math.cos(z)
+        x3 = x2 * cos_z - y1 * sin_z
+        y3 = x2 * sin_z + y1 * cos_z
 
         return Point3D(x3, y3, z2)
 
@@ -237,12 +249,24 @@ def sign(x: float) -> int:
     :return: The sign of the number.
     :rtype: int
     """
-    if x < 0:
-        return -1
-    elif x > 0:
-        return 1
-    else:
-        return 0
+    return (x > 0) - (x < 0)
+
+
+def _squared_distance(p1: Point3D, p2: Point3D) -> float:
+    """Calculate the squared distance between two points.
+
+    :param p1: The first point.
+    :type p1: Point3D
+    :param p2: The second point.
+    :type p2: Point3D
+    :return: The squared distance between the two points.
+    :rtype: float
+
+    Comparing squared distances against squared thresholds avoids a square root in
+    containment and intersection tests.
+    """
+    dx, dy, dz = p2.x - p1.x, p2.y - p1.y, p2.z - p1.z
+    return dx * dx + dy * dy + dz * dz
 
 
 def gram_schmidt(n: Vector3D) -> ty.Tuple[Vector3D, Vector3D]:
@@ -252,8 +276,18 @@ def gram_schmidt(n: Vector3D) -> ty.Tuple[Vector3D, Vector3D]:
     :type n: Vector3D
     :return: Two orthogonal vectors.
     :rtype: ty.Tuple[Vector3D, Vector3D]
+
+    The process is started from the world axis that is least parallel to the given
+    vector, which keeps the result numerically stable and deterministic.
     """
-    v = Vector3D.create_random()
+    ax, ay, az = abs(n.x), abs(n.y), abs(n.z)
+    if ax <= ay and ax <= az:
+        v = Vector3D(1.0, 0.0, 0.0)
+    elif ay <= az:
+        v = Vector3D(0.0, 1.0, 0.0)
+    else:
+        v = Vector3D(0.0, 0.0, 1.0)
+
     v = v.subtract(n.multiply(v.dot(n))).normalize()
     w = n.cross(v)
     return v, w
@@ -274,6 +308,8 @@ class Line3D:
     :type end: Point3D
     """
 
+    __slots__ = ("start", "end")
+
     start: Point3D
     end: Point3D
 
@@ -288,6 +324,8 @@ class Plane3D:
     :type normal: Vector3D
     """
 
+    __slots__ = ("center", "normal")
+
     center: Point3D
     normal: Vector3D
 
@@ -304,6 +342,8 @@ class Circle3D:
     :type normal: Vector3D
     """
 
+    __slots__ = ("center", "radius", "normal")
+
     center: Point3D
     radius: float
     normal: Vector3D
@@ -319,6 +359,8 @@ class Sphere:
     :type radius: float
     """
 
+    __slots__ = ("center", "radius")
+
     center: Point3D
     radius: float
 
@@ -351,6 +393,8 @@ class Cylinder:
     :type cap_type: CylinderCapType
     """
 
+    __slots__ = ("start", "end", "radius", "cap_type")
+
     start: Point3D
     end: Point3D
     radius: float
@@ -373,10 +417,17 @@ def same_side_of_plane(plane: Plane3D, p1: Point3D, p2: Point3D) -> bool:
     :type p2: Point3D
     :return: True if the points are on the same side of the plane, False otherwise.
     :rtype: bool
+
+    A point that lies on the plane is not on either side of it.
     """
-    left = sign(p1.create_vector(plane.center).dot(plane.normal))
-    right = sign(p2.create_vector(plane.center).dot(plane.normal))
-    return left == right
+    cx, cy, cz = plane.center.x, plane.center.y, plane.center.z
+    nx, ny, nz = plane.normal.x, plane.normal.y, plane.normal.z
+    left = (cx - p1.x) * nx + (cy - p1.y) * ny + (cz - p1.z) * nz
+    right = (cx - p2.x) * nx + (cy - p2.y) * ny + (cz - p2.z) * nz
+
+    # The signed distances (up to the length of the normal) have the same sign
+    # exactly when their product is positive.
+    return left * right > 0.0
 
 
 # ==============================================================================
@@ -394,12 +445,23 @@ def distance_to_line(line: Line3D, point: Point3D) -> float:
     :return: The distance from the point to the line.
     :rtype: float
     """
-    d = line.end.create_vector(line.start).normalize()
-    s = line.start.create_vector(point).dot(d)
-    t = point.create_vector(line.end).dot(d)
-    h = max(s, t, 0.0)
-    c = point.create_vector(line.start).cross(d).length()
-    return math.sqrt(h * h + c * c)  # Pythagorean theorem.
+    sx, sy, sz = line.start.x, line.start.y, line.start.z
+    abx, aby, abz = line.end.x - sx, line.end.y - sy, line.end.z - sz
+    apx, apy, apz = point.x - sx, point.y - sy, point.z - sz
+    ab2 = abx * abx + aby * aby + abz * abz
+    ap_ab = apx * abx + apy * aby + apz * abz
+
+    # Projection falls before the start of the segment (or the segment is a point).
+    if ap_ab <= 0.0 or ab2 <= 0.0:
+        return math.hypot(apx, apy, apz)
+
+    # Projection falls beyond the end of the segment.
+    if ap_ab >= ab2:
+        return math.hypot(point.x - line.end.x, point.y - line.end.y, point.z - line.end.z)
+
+    # Perpendicular distance |ap x ab| / |ab|, expanded as |ap|^2 - (ap . ab)^2 / |ab|^2.
+    ap2 = apx * apx + apy * apy + apz * apz
+    return math.sqrt(max(0.0, ap2 - ap_ab * ap_ab / ab2))
 
 
 # ==============================================================================
@@ -480,38 +542,59 @@ def get_points_on_line_3d(line: Line3D, num_points: int) -> ty.List[Point3D]:
     return points
 
 
-def get_points_on_circumference_circle_3d(circle: Circle3D, num_points: int) -> ty.List[Point3D]:
-    """Generate points on the circumference of the circle.
+def _get_points_on_ring(
+    center: Point3D, radius: float, v: Vector3D, w: Vector3D, num_points: int
+) -> ty.List[Point3D]:
+    """Generate points on a ring spanned by two orthonormal basis vectors.
 
-    :param circle: The circle.
-    :type circle: Circle3D
+    :param center: The center of the ring.
+    :type center: Point3D
+    :param radius: The radius of the ring.
+    :type radius: float
+    :param v: The first basis vector of the plane of the ring.
+    :type v: Vector3D
+    :param w: The second basis vector of the plane of the ring.
+    :type w: Vector3D
     :param num_points: The number of points to generate.
     :type num_points: int
-    :return: The points on the circumference of the circle.
+    :return: The points on the ring.
     :rtype: ty.List[Point3D]
     """
     angles = [2 * math.pi * i / num_points for i in range(num_points)]
-    normal = circle.normal.normalize()
-    v, w = gram_schmidt(normal)
 
-    cos_angles = [math.cos(angle) for angle in angles]
-    sin_angles = [math.sin(angle) for angle in angles]
+    cx, cy, cz = center.x, center.y, center.z
 
-    cx, cy, cz = circle.center.x, circle.center.y, circle.center.z
-    r = circle.radius
+    # Scale the basis vectors by the radius once instead of for every point.
+    vx, vy, vz = radius * v.x, radius * v.y, radius * v.z
+    wx, wy, wz = radius * w.x, radius * w.y, radius * w.z
 
     points = []
-    for cos_a, sin_a in zip(cos_angles, sin_angles):
+    for angle in angles:
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
         point = Point3D(
-            cx + r * cos_a * v.x + r * sin_a * w.x,
-            cy + r * cos_a * v.y + r * sin_a * w.y,
-            cz + r * cos_a * v.z + r * sin_a * w.z,
+            cx + cos_a * vx + sin_a * wx,
+            cy + cos_a * vy + sin_a * wy,
+            cz + cos_a * vz + sin_a * wz,
         )
         points.append(point)
 
     return points
 
 
+def get_points_on_circumference_circle_3d(circle: Circle3D, num_points: int) -> ty.List[Point3D]:
+    """Generate points on the circumference of the circle.
+
+    :param circle: The circle.
+    :type circle: Circle3D
+    :param num_points: The number of points to generate.
+    :type num_points: int
+    :return: The points on the circumference of the circle.
+    :rtype: ty.List[Point3D]
+    """
+    v, w = gram_schmidt(circle.normal.normalize())
+    return _get_points_on_ring(circle.center, circle.radius, v, w, num_points)
+
+
 def get_points_on_surface_circle_3d(
     circle: Circle3D, num_radii: int, num_points: int
 ) -> ty.List[Point3D]:
@@ -528,14 +611,39 @@ def get_points_on_surface_circle_3d(
     """
     radii = [circle.radius * i / num_radii for i in range(num_radii)]
 
+    # All concentric rings lie in the same plane, so they share a basis.
+    v, w = gram_schmidt(circle.normal.normalize())
+
     points = []
     for radius in radii:
-        temp_circle = Circle3D(circle.center, radius, circle.normal)
-        points.extend(get_points_on_circumference_circle_3d(temp_circle, num_points))
+        points.extend(_get_points_on_ring(circle.center, radius, v, w, num_points))
 
     return points
 
 
+@lru_cache(maxsize=32)
+def _get_sphere_angle_tables(
+    num_phi: int, num_theta: int
+) -> ty.Tuple[ty.Tuple[ty.Tuple[float, float], ...], ty.Tuple[ty.Tuple[float, float], ...]]:
+    """Get the cosines and sines of the angles used to generate points on a sphere.
+
+    :param num_phi: The resolution of the sphere in the phi direction.
+    :type num_phi: int
+    :param num_theta: The resolution of the sphere in the theta direction.
+    :type num_theta: int
+    :return: The (cosine, sine) pairs of all phi angles and of all theta angles.
+    :rtype: ty.Tuple[ty.Tuple[ty.Tuple[float, float], ...], ty.Tuple[ty.Tuple[float, float], ...]]
+
+    The tables only depend on the resolution, which is the same for all spheres in a
+    scene, so they are cached and shared between spheres.
+    """
+    phis = [2 * math.pi * i / num_phi for i in range(num_phi + 1)]
+    thetas = [math.pi * i / num_theta for i in range(num_theta + 1)]
+    phi_table = tuple((math.cos(phi), math.sin(phi)) for phi in phis)
+    theta_table = tuple((math.cos(theta), math.sin(theta)) for theta in thetas)
+    return phi_table, theta_table
+
+
 def get_points_on_surface_sphere(
     sphere: Sphere, num_phi: int, num_theta: int, filter_for_pov: bool = True
 ) -> ty.List[Point3D]:
@@ -553,27 +661,26 @@ def get_points_on_surface_sphere(
     :return: The points on the surface of the sphere.
     :rtype: ty.List[Point3D]
     """
-    phis = [2 * math.pi * i / num_phi for i in range(num_phi + 1)]
-    thetas = [math.pi * i / num_theta for i in range(num_theta + 1)]
+    phi_table, theta_table = _get_sphere_angle_tables(num_phi, num_theta)
 
     cx, cy, cz = sphere.center.x, sphere.center.y, sphere.center.z
     r = sphere.radius
 
     points = []
-    for theta in thetas:
-        for phi in phis:
-            x = cx + r * math.sin(theta) * math.cos(phi)
-            y = cy + r * math.sin(theta) * math.sin(phi)
-            z = cz + r * math.cos(theta)
-
-            # Only add points that are on the surface of the sphere we can see.
-            if not filter_for_pov:
-                points.append(Point3D(x, y, z))
-                continue
-
-            # Check if point is on the surface of the sphere we can see.
-            if z >= sphere.center.z:
-                points.append(Point3D(x, y, z))
+    for cos_theta, sin_theta in theta_table:
+        # The z-coordinate only depends on theta, so a ring is either entirely
+        # visible from the POV or not at all.
+        z = cz + r * cos_theta
+        if filter_for_pov and z < cz:
+            continue
+
+        r_sin_theta = r * sin_theta
+        points.extend(
+            [
+                Point3D(cx + r_sin_theta * cos_phi, cy + r_sin_theta * sin_phi, z)
+                for cos_phi, sin_phi in phi_table
+            ]
+        )
 
     return points
 
@@ -586,6 +693,7 @@ def get_points_on_surface_cap(
     center_cylinder: Point3D,
     resolution: int,
     filter_for_pov: bool = True,
+    basis: ty.Optional[ty.Tuple[Vector3D, Vector3D]] = None,
 ) -> ty.List[Point3D]:
     """Generate points on the surface of the cap.
 
@@ -605,6 +713,9 @@ def get_points_on_surface_cap(
         of the cap (i.e. the surface of the cap we can see from POV positive z-axis
         towards origin).
     :type filter_for_pov: bool
+    :param basis: Orthonormal basis (v, w) perpendicular to the normal of the cap. If
+        None, the basis is calculated from the normal. Only used for flat caps.
+    :type basis: ty.Optional[ty.Tuple[Vector3D, Vector3D]]
     :return: The points on the surface of the cap.
     :rtype: ty.List[Point3D]
     :raises ValueError: If the cap type is unknown.
@@ -613,22 +724,34 @@ def get_points_on_surface_cap(
         return []
 
     elif cap_type == CylinderCapType.FLAT:
-        circle = Circle3D(center_cap, radius_cap, normal_cap)
-        return get_points_on_circumference_circle_3d(circle, resolution)
+        if basis is None:
+            basis = gram_schmidt(normal_cap.normalize())
+        v, w = basis
+        return _get_points_on_ring(center_cap, radius_cap, v, w, resolution)
 
     elif cap_type == CylinderCapType.ROUND:
         sphere = Sphere(center_cap, radius_cap)
-        plane = Plane3D(center_cap, normal_cap)
 
         points = get_points_on_surface_sphere(
             sphere, resolution, resolution, filter_for_pov=filter_for_pov
         )
 
-        points = [
-            point for point in points if not same_side_of_plane(plane, center_cylinder, point)
-        ]
+        # Keep the points that are not on the same side of the plane through the cap
+        # as the center of the cylinder (see same_side_of_plane). The side of the
+        # center of the cylinder is the same for every point and is calculated once.
+        cx, cy, cz = center_cap.x, center_cap.y, center_cap.z
+        nx, ny, nz = normal_cap.x, normal_cap.y, normal_cap.z
+        ref = (
+            (cx - center_cylinder.x) * nx
+            + (cy - center_cylinder.y) * ny
+            + (cz - center_cylinder.z) * nz
+        )
 
-        return points
+        return [
+            point
+            for point in points
+            if ((cx - point.x) * nx + (cy - point.y) * ny + (cz - point.z) * nz) * ref <= 0.0
+        ]
 
     else:
         raise ValueError(f"Unknown cap type: '{cap_type}'")
@@ -650,21 +773,43 @@ def get_points_on_surface_cylinder(
     normal = cylinder.end.create_vector(cylinder.start).normalize()
     centers = get_points_on_line_3d(Line3D(cylinder.start, cylinder.end), resolution)
 
-    points = []
-    for center in centers:
-        circle = Circle3D(center, cylinder.radius, normal)
-        points.extend(get_points_on_circumference_circle_3d(circle, resolution))
+    # All rings along the axis are the same circle translated to a different center,
+    # so the ring is generated once around the origin and then offset per center.
+    v, w = gram_schmidt(normal)
+    origin = Point3D(0.0, 0.0, 0.0)
+    ring = [(p.x, p.y, p.z) for p in _get_points_on_ring(origin, cylinder.radius, v, w, resolution)]
+
+    points = [
+        Point3D(center.x + dx, center.y + dy, center.z + dz)
+        for center in centers
+        for dx, dy, dz in ring
+    ]
 
     # Get points on the caps.
     cap_type = cylinder.cap_type
 
+    # The caps share the basis of the rings along the axis.
     cap_points = get_points_on_surface_cap(
-        cap_type, cylinder.start, cylinder.radius, normal, cylinder.end, resolution, False
+        cap_type,
+        cylinder.start,
+        cylinder.radius,
+        normal,
+        cylinder.end,
+        resolution,
+        False,
+        basis=(v, w),
     )
     points.extend(cap_points)
 
     cap_points = get_points_on_surface_cap(
-        cap_type, cylinder.end, cylinder.radius, normal, cylinder.start, resolution, False
+        cap_type,
+        cylinder.end,
+        cylinder.radius,
+        normal,
+        cylinder.start,
+        resolution,
+        False,
+        basis=(v, w),
     )
     points.extend(cap_points)
 
@@ -686,7 +831,57 @@ def point_is_inside_sphere(sphere: Sphere, point: Point3D) -> bool:
     :return: True if the point is inside the sphere, False otherwise.
     :rtype: bool
     """
-    return sphere.center.calculate_distance(point) <= sphere.radius
+    return _squared_distance(sphere.center, point) <= sphere.radius * sphere.radius
+
+
+def _point_is_inside_round_cylinder(cylinder: Cylinder, point: Point3D) -> bool:
+    """Check if a point is inside a cylinder with round caps.
+
+    :param cylinder: The cylinder to check.
+    :type cylinder: Cylinder
+    :param point: The point to check.
+    :type point: Point3D
+    :return: True if the point is inside the cylinder, False otherwise.
+    :rtype: bool
+    """
+    line = Line3D(cylinder.start, cylinder.end)
+    return distance_to_line(line, point) <= cylinder.radius
+
+
+def _point_is_inside_flat_cylinder(cylinder: Cylinder, point: Point3D) -> bool:
+    """Check if a point is inside a cylinder with flat or no caps.
+
+    :param cylinder: The cylinder to check.
+    :type cylinder: Cylinder
+    :param point: The point to check.
+    :type point: Point3D
+    :return: True if the point is inside the cylinder, False otherwise.
+    :rtype: bool
+    """
+    normal = cylinder.end.create_vector(cylinder.start).normalize()
+    plane1 = Plane3D(cylinder.start, normal)
+    plane2 = Plane3D(cylinder.end, normal)
+    is_between_planes = same_side_of_plane(plane1, point, cylinder.end) and same_side_of_plane(
+        plane2, point, cylinder.start
+    )
+    if not is_between_planes:
+        return False
+
+    line = Line3D(cylinder.start, cylinder.end)
+    return distance_to_line(line, point) <= cylinder.radius
+
+
+_CYLINDER_INSIDE_TESTS: ty.Dict[CylinderCapType, ty.Callable[[Cylinder, Point3D], bool]] = {
+    CylinderCapType.ROUND: _point_is_inside_round_cylinder,
+    CylinderCapType.FLAT: _point_is_inside_flat_cylinder,
+    CylinderCapType.NO_CAP: _point_is_inside_flat_cylinder,
+}
+
+_CYLINDER_HAS_FLAT_ENDS: ty.Dict[CylinderCapType, bool] = {
+    CylinderCapType.ROUND: False,
+    CylinderCapType.FLAT: True,
+    CylinderCapType.NO_CAP: True,
+}
 
 
 def point_is_inside_cylinder(cylinder: Cylinder, point: Point3D) -> bool:
@@ -700,24 +895,73 @@ def point_is_inside_cylinder(cylinder: Cylinder, point: Point3D) -> bool:
     :rtype: bool
     :raises ValueError: If the cap type is unknown.
     """
-    line = Line3D(cylinder.start, cylinder.end)
-    dist = distance_to_line(line, point)
-    cap_type = cylinder.cap_type
+    inside_test = _CYLINDER_INSIDE_TESTS.get(cylinder.cap_type)
 
-    if cap_type == CylinderCapType.ROUND:
-        return dist <= cylinder.radius
+    if inside_test is None:
+        raise ValueError(f"Unknown cap type: '{cylinder.cap_type}'")
 
-    elif cap_type == CylinderCapType.FLAT or cap_type == CylinderCapType.NO_CAP:
-        normal = cylinder.end.create_vector(cylinder.start).normalize()
-        plane1 = Plane3D(cylinder.start, normal)
-        plane2 = Plane3D(cylinder.end, normal)
-        is_between_planes = same_side_of_plane(plane1, point, cylinder.end) and same_side_of_plane(
-            plane2, point, cylinder.start
-        )
-        return dist <= cylinder.radius and is_between_planes
+    return inside_test(cylinder, point)
 
-    else:
-        raise ValueError(f"Unknown cap type: '{cap_type}'")
+
+def points_are_inside_sphere(sphere: Sphere, points: ty.List[Point3D]) -> ty.List[bool]:
+    """Check for multiple points if they are inside the sphere.
+
+    :param sphere: The sphere to check.
+    :type sphere: Sphere
+    :param points: The points to check.
+    :type points: ty.List[Point3D]
+    :return: For every point True if it is inside the sphere, False otherwise.
+    :rtype: ty.List[bool]
+    """
+    cx, cy, cz = sphere.center.x, sphere.center.y, sphere.center.z
+    r2 = sphere.radius * sphere.radius
+
+    return [
+        (p.x - cx) * (p.x - cx) + (p.y - cy) * (p.y - cy) + (p.z - cz) * (p.z - cz) <= r2
+        for p in points
+    ]
+
+
+def points_are_inside_cylinder(cylinder: Cylinder, points: ty.List[Point3D]) -> ty.List[bool]:
+    """Check for multiple points if they are inside the cylinder.
+
+    :param cylinder: The cylinder to check.
+    :type cylinder: Cylinder
+    :param points: The points to check.
+    :type points: ty.List[Point3D]
+    :return: For every point True if it is inside the cylinder, False otherwise.
+    :rtype: ty.List[bool]
+    :raises ValueError: If the cap type is unknown.
+    """
+    has_flat_ends = _CYLINDER_HAS_FLAT_ENDS.get(cylinder.cap_type)
+
+    if has_flat_ends is None:
+        raise ValueError(f"Unknown cap type: '{cylinder.cap_type}'")
+
+    # Everything that only depends on the cylinder is calculated once for all points.
+    sx, sy, sz = cylinder.start.x, cylinder.start.y, cylinder.start.z
+    abx, aby, abz = cylinder.end.x - sx, cylinder.end.y - sy, cylinder.end.z - sz
+    ab2 = abx * abx + aby * aby + abz * abz
+    inv_ab2 = 1.0 / ab2 if ab2 > 0 else 0.0
+    r2 = cylinder.radius * cylinder.radius
+
+    inside = []
+    for p in points:
+        apx, apy, apz = p.x - sx, p.y - sy, p.z - sz
+
+        # Position of the projection of the point on the axis, where 0 is the start
+        # and 1 is the end of the cylinder.
+        t = (apx * abx + apy * aby + apz * abz) * inv_ab2
+
+        if has_flat_ends and not 0.0 < t < 1.0:
+            inside.append(False)
+            continue
+
+        t = min(max(t, 0.0), 1.0)
+        dx, dy, dz = apx - t * abx, apy - t * aby, apz - t * abz
+        inside.append(dx * dx + dy * dy + dz * dz <= r2)
+
+    return inside
 
 
 # ==============================================================================
@@ -737,7 +981,7 @@ def sphere_intersects_with_sphere(sphere1: Sphere, sphere2: Sphere) -> bool:
     """
     c1, r1 = sphere1.center, sphere1.radius
     c2, r2 = sphere2.center, sphere2.radius
-    return c1.calculate_distance(c2) <= r1 + r2
+    return _squared_distance(c1, c2) <= (r1 + r2) * (r1 + r2)
 
 
 def sphere_intersects_with_cylinder(sphere: Sphere, cylinder: Cylinder) -> bool:
@@ -751,9 +995,10 @@ def sphere_intersects_with_cylinder(sphere: Sphere, cylinder: Cylinder) -> bool:
     :rtype: bool
     """
     d = sphere.radius + cylinder.radius
+    d2 = d * d
     return (
-        sphere.center.calculate_distance(cylinder.start) <= d
-        or sphere.center.calculate_distance(cylinder.end) <= d
+        _squared_distance(sphere.center, cylinder.start) <= d2
+        or _squared_distance(sphere.center, cylinder.end) <= d2
     )
 
 
@@ -768,9 +1013,10 @@ def cylinder_intersects_with_cylinder(cylinder1: Cylinder, cylinder2: Cylinder)
     :rtype: bool
     """
     d = cylinder1.radius + cylinder2.radius
+    d2 = d * d
     return (
-        cylinder1.start.calculate_distance(cylinder2.start) <= d
-        or cylinder1.start.calculate_distance(cylinder2.end) <= d
-        or cylinder1.end.calculate_distance(cylinder2.start) <= d
-        or cylinder1.end.calculate_distance(cylinder2.end) <= d
+        _squared_distance(cylinder1.start, cylinder2.start) <= d2
+        or _squared_distance(cylinder1.start, cylinder2.end) <= d2
+        or _squared_distance(cylinder1.end, cylinder2.start) <= d2
+        or _squared_distance(cylinder1.end, cylinder2.end) <= d2
     )
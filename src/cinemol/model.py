@@ -15,8 +15,8 @@ from cinemol.geometry import (
     cylinder_intersects_with_cylinder,
     get_points_on_surface_cylinder,
     get_points_on_surface_sphere,
-    point_is_inside_cylinder,
-    point_is_inside_sphere,
+    points_are_inside_cylinder,
+    points_are_inside_sphere,
     sphere_intersects_with_cylinder,
     sphere_intersects_with_sphere,
 )
@@ -136,27 +136,35 @@ def get_node_polygon_vertices(
         # If node is not a sphere or cylinder (i.e., unsupported geometries), return empty list.
         return []
 
-    # Check if point is visible (i.e, not inside any other node geometry).
-    visible_points = []
-    for point in points:
-        for node in others:
-            if isinstance(node, ModelSphere) and point_is_inside_sphere(node.geometry, point):
-                break
+    # Check if point is visible (i.e, not inside any other node geometry). Points are
+    # tested in bulk per node, so that node specific values are only calculated once.
+    for node in others:
+        if not points:
+            break
+
+        if isinstance(node, ModelSphere):
+            inside = points_are_inside_sphere(node.geometry, points)
 
-            elif isinstance(node, ModelCylinder) and point_is_inside_cylinder(node.geometry, point):
-                break
+        elif isinstance(node, ModelCylinder):
+            inside = points_are_inside_cylinder(node.geometry, points)
 
         else:
-            x, y, z = point.x, point.y, point.z
+            continue
 
-            if focal_length is not None:
-                factor = focal_length / (z - focal_length)
-                if factor < 0:  # Point is behind the point of view.
-                    continue
-            else:
-                factor = 1.0
+        points = [point for point, is_inside in zip(points, inside) if not is_inside]
+
+    visible_points = []
+    for point in points:
+        x, y, z = point.x, point.y, point.z
+
+        if focal_length is not None:
+            factor = focal_length / (z - focal_length)
+            if factor < 0:  # Point is behind the point of view.
+                continue
+        else:
+            factor = 1.0
 
-            visible_points.append(Point2D(x * factor, y * factor))
+        visible_points.append(Point2D(x * factor, y * factor))
 
     # If no visible points, return empty list.
     if len(visible_points) == 0:
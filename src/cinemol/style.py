@@ -5,6 +5,7 @@
 import typing as ty
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from cinemol.geometry import Point2D
 
@@ -16,6 +17,8 @@ from cinemol.geometry import Point2D
 class Color:
     """A color in RGB format."""
 
+    __slots__ = ("_rgb",)
+
     def __init__(self, r: int, g: int, b: int) -> None:
         """Initialize the color.
 
@@ -32,9 +35,54 @@ class Color:
                 f"Expected (r=int, g=int, b=int), got'(r={type(r)}, g={type(g)}, b={type(b)})'"
             )
 
-        self.r = max(0, min(255, r))
-        self.g = max(0, min(255, g))
-        self.b = max(0, min(255, b))
+        r = max(0, min(255, r))
+        g = max(0, min(255, g))
+        b = max(0, min(255, b))
+
+        # The channels are packed into a single integer as 0xRRGGBB.
+        self._rgb = (r << 16) | (g << 8) | b
+
+    @classmethod
+    def _raw(cls, rgb: int) -> "Color":
+        """Create a color from a packed value without validation.
+
+        :param rgb: The packed color as 0xRRGGBB, with every channel in range.
+        :type rgb: int
+        :return: The color.
+        :rtype: Color
+
+        Only meant for internal use, where the channels are known to be valid.
+        """
+        color = cls.__new__(cls)
+        color._rgb = rgb
+        return color
+
+    @property
+    def r(self) -> int:
+        """Return the red component of the color.
+
+        :return: The red component of the color.
+        :rtype: int
+        """
+        return (self._rgb >> 16) & 0xFF
+
+    @property
+    def g(self) -> int:
+        """Return the green component of the color.
+
+        :return: The green component of the color.
+        :rtype: int
+        """
+        return (self._rgb >> 8) & 0xFF
+
+    @property
+    def b(self) -> int:
+        """Return the blue component of the color.
+
+        :return: The blue component of the color.
+        :rtype: int
+        """
+        return self._rgb & 0xFF
 
     def __str__(self) -> str:
         """Return the string representation of the color.
@@ -42,7 +90,7 @@ class Color:
         :return: The string representation of the color.
         :rtype: str
         """
-        return f"rgb({self.r},{self.g},{self.b})"
+        return _format_rgb(self._rgb)
 
     def __eq__(self, other: ty.Any) -> bool:
         """Check if self is equal to other.
@@ -55,7 +103,15 @@ class Color:
         if not isinstance(other, Color):
             return False
 
-        return (self.r == other.r) and (self.g == other.g) and (self.b == other.b)
+        return self._rgb == other._rgb
+
+    def __hash__(self) -> int:
+        """Return the hash of the color.
+
+        :return: The hash of the color.
+        :rtype: int
+        """
+        return hash(self._rgb)
 
     def to_hex(self) -> str:
         """Convert color to a hex string.
@@ -63,11 +119,15 @@ class Color:
         :return: Hex representation of the color.
         :rtype: str
         """
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return _format_hex(self._rgb)
 
     def diffuse(self, alpha: float) -> "Color":
         """Diffuse color with alpha value.
 
+        The diffusion factor is quantized to steps of 1/256 and every channel is
+        rounded down, so for factors that are not a multiple of 1/256 a channel can
+        end up one step darker than ``int(channel * alpha)``.
+
         :param alpha: Diffusion factor.
         :type alpha: float
         :return: Diffused color.
@@ -78,9 +138,56 @@ class Color:
             raise TypeError(f"Expected alpha to be float, got '{type(alpha)}'")
 
         alpha = max(0, min(1, alpha))
-        color = Color(int(self.r * alpha), int(self.g * alpha), int(self.b * alpha))
 
-        return color
+        return _diffuse(self._rgb, alpha)
+
+
+# Colors are immutable and a scene only uses a handful of distinct ones, so their
+# string representations and diffused variants are memoized on the packed value.
+
+
+@lru_cache(maxsize=1024)
+def _format_rgb(rgb: int) -> str:
+    """Format a packed color as an rgb() string.
+
+    :param rgb: The packed color as 0xRRGGBB.
+    :type rgb: int
+    :return: The rgb() representation of the color.
+    :rtype: str
+    """
+    return f"rgb({rgb >> 16},{(rgb >> 8) & 0xFF},{rgb & 0xFF})"
+
+
+@lru_cache(maxsize=1024)
+def _format_hex(rgb: int) -> str:
+    """Format a packed color as a hex string.
+
+    :param rgb: The packed color as 0xRRGGBB.
+    :type rgb: int
+    :return: Hex representation of the color.
+    :rtype: str
+    """
+    return f"#{rgb:06x}"
+
+
+@lru_cache(maxsize=1024)
+def _diffuse(rgb: int, alpha: float) -> Color:
+    """Diffuse a packed color with an alpha value.
+
+    :param rgb: The packed color as 0xRRGGBB.
+    :type rgb: int
+    :param alpha: Diffusion factor between 0 and 1.
+    :type alpha: float
+    :return: Diffused color.
+    :rtype: Color
+    """
+    # Scale the packed channels with a fixed-point factor in [0, 256]. Red and
+    # blue are 16 bits apart, so they can be multiplied together without their
+    # products overlapping; green is multiplied separately.
+    a = int(alpha * 256)
+    rb = (((rgb & 0xFF00FF) * a) >> 8) & 0xFF00FF
+    g = (((rgb & 0x00FF00) * a) >> 8) & 0x00FF00
+    return Color._raw(rb | g)
 
 
 # ==============================================================================
@@ -88,6 +195,30 @@ class Color:
 # ==============================================================================
 
 
+# O and I are defined as Oxygen and Iodine on the schemes because otherwise the
+# attribute names would be ambiguous according to PEP8.
+_ATOM_SYMBOL_ATTRIBUTE_ALIASES = {"Oxygen": "O", "Iodine": "I"}
+
+_T = ty.TypeVar("_T")
+
+
+def _get_atom_symbol_table(scheme: type, value_type: ty.Type[_T]) -> ty.Dict[str, _T]:
+    """Collect the per-element class attributes of a scheme into a lookup table.
+
+    :param scheme: The scheme class that defines the per-element attributes.
+    :type scheme: type
+    :param value_type: The type of the per-element attributes.
+    :type value_type: ty.Type[_T]
+    :return: The per-element values keyed by atom symbol.
+    :rtype: ty.Dict[str, _T]
+    """
+    return {
+        _ATOM_SYMBOL_ATTRIBUTE_ALIASES.get(name, name): value
+        for name, value in vars(scheme).items()
+        if isinstance(value, value_type)
+    }
+
+
 class AtomColoringScheme(ABC):
     """Abstract base class for atom coloring schemes."""
 
@@ -150,16 +281,11 @@ class CoreyPaulingKoltungAtomColor(AtomColoringScheme):
         :return: The color of the atom.
         :rtype: Color
         """
-        default = Color(255, 192, 203)  # Pink
+        return _CPK_ATOM_COLORS.get(atom_symbol, _CPK_DEFAULT_ATOM_COLOR)
+
 
-        # We define O and I separately because otherwise the variable name would
-        # be ambiguous according to PEP8.
-        if atom_symbol == "O":
-            return self.Oxygen
-        elif atom_symbol == "I":
-            return self.Iodine
-        else:
-            return getattr(self, atom_symbol, default)
+_CPK_ATOM_COLORS = _get_atom_symbol_table(CoreyPaulingKoltungAtomColor, Color)
+_CPK_DEFAULT_ATOM_COLOR = Color(255, 192, 203)  # Pink
 
 
 # ==============================================================================
@@ -270,17 +396,12 @@ class PubChemAtomRadius(AtomRadiusScheme):
         :return: The radius of the atom in angstrom.
         :rtype: float
         """
-        default = 170.0
         factor = 0.01  # Convert from picometer to angstrom.
+        return _PUBCHEM_ATOM_RADII.get(atom_symbol, _PUBCHEM_DEFAULT_ATOM_RADIUS) * factor
 
-        # We define O and I separately because otherwise the variable name would
-        # be ambiguous according to PEP8.
-        if atom_symbol == "O":
-            return self.Oxygen * factor
-        elif atom_symbol == "I":
-            return self.Iodine * factor
-        else:
-            return getattr(self, atom_symbol, default) * factor
+
+_PUBCHEM_ATOM_RADII = _get_atom_symbol_table(PubChemAtomRadius, float)
+_PUBCHEM_DEFAULT_ATOM_RADIUS = 170.0
 
 
 # ==============================================================================
@@ -411,6 +532,166 @@ class LinearGradient(FillStyle):
         self.opacity = opacity
 
 
+# Templates for the SVG representations of the fill styles. The templates are ASCII
+# bytes formatted with %-interpolation, so fills can be appended to a byte buffer
+# without building intermediate strings.
+_WIRE_STYLE_TEMPLATE = (
+    b".%s"
+    b"{stroke:%s;"
+    b"stroke-width:%.3fpx;"
+    b"stroke-opacity:%s;"
+    b"stroke-linecap:round;"
+    b"stroke-linejoin:round;}"
+)
+
+_SOLID_STYLE_TEMPLATE = b".%s{fill:%s;stroke:%s;stroke-width:%.3fpx;opacity:%s;}"
+
+_GRADIENT_STYLE_TEMPLATE = b".%s{fill:url(#%s);}"
+
+_RADIAL_GRADIENT_DEFINITION_TEMPLATE = (
+    b"<radialGradient"
+    b' id="%s"'
+    b' cx="%.3f" cy="%.3f"'
+    b' r="%.3f" fx="%.3f" fy="%.3f"'
+    b' gradientTransform="matrix(1,0,0,1,0,0)"'
+    b' gradientUnits="userSpaceOnUse"'
+    b' opacity="%s">'
+    b'<stop offset="0.00" stop-color="%s"/>'
+    b'<stop offset="1.00" stop-color="%s"/>'
+    b"</radialGradient>"
+)
+
+_LINEAR_GRADIENT_DEFINITION_TEMPLATE = (
+    b"<linearGradient"
+    b' id="%s"'
+    b' x1="%.3f" y1="%.3f"'
+    b' x2="%.3f" y2="%.3f"'
+    b' gradientUnits="userSpaceOnUse"'
+    b' spreadMethod="reflect"'
+    b' gradientTransform="rotate(90)"'
+    b' opacity="%s">'
+    b'<stop offset="0.00" stop-color="%s"/>'
+    b'<stop offset="1.00" stop-color="%s"/>'
+    b"</linearGradient>"
+)
+
+
+def _wire_to_svg(
+    reference: bytes, fill_style: Wire, style_out: bytearray, definition_out: bytearray
+) -> None:
+    """Append the SVG representation of a wire fill style to byte buffers.
+
+    :param reference: The ASCII encoded reference of the fill style.
+    :type reference: bytes
+    :param fill_style: The wire fill style.
+    :type fill_style: Wire
+    :param style_out: The buffer to append the style string to.
+    :type style_out: bytearray
+    :param definition_out: The buffer to append the definition string to.
+    :type definition_out: bytearray
+    """
+    style_out += _WIRE_STYLE_TEMPLATE % (
+        reference,
+        fill_style.stroke_color.to_hex().encode("ascii"),
+        fill_style.stroke_width,
+        str(fill_style.opacity).encode("ascii"),
+    )
+
+
+def _solid_to_svg(
+    reference: bytes, fill_style: Solid, style_out: bytearray, definition_out: bytearray
+) -> None:
+    """Append the SVG representation of a solid fill style to byte buffers.
+
+    :param reference: The ASCII encoded reference of the fill style.
+    :type reference: bytes
+    :param fill_style: The solid fill style.
+    :type fill_style: Solid
+    :param style_out: The buffer to append the style string to.
+    :type style_out: bytearray
+    :param definition_out: The buffer to append the definition string to.
+    :type definition_out: bytearray
+    """
+    style_out += _SOLID_STYLE_TEMPLATE % (
+        reference,
+        fill_style.fill_color.to_hex().encode("ascii"),
+        fill_style.stroke_color.to_hex().encode("ascii"),
+        fill_style.stroke_width,
+        str(fill_style.opacity).encode("ascii"),
+    )
+
+
+def _radial_gradient_to_svg(
+    reference: bytes,
+    fill_style: RadialGradient,
+    style_out: bytearray,
+    definition_out: bytearray,
+) -> None:
+    """Append the SVG representation of a radial gradient fill style to byte buffers.
+
+    :param reference: The ASCII encoded reference of the fill style.
+    :type reference: bytes
+    :param fill_style: The radial gradient fill style.
+    :type fill_style: RadialGradient
+    :param style_out: The buffer to append the style string to.
+    :type style_out: bytearray
+    :param definition_out: The buffer to append the definition string to.
+    :type definition_out: bytearray
+    """
+    cx, cy = fill_style.center.x, fill_style.center.y
+    style_out += _GRADIENT_STYLE_TEMPLATE % (reference, reference)
+    definition_out += _RADIAL_GRADIENT_DEFINITION_TEMPLATE % (
+        reference,
+        cx,
+        cy,
+        fill_style.radius,
+        cx,
+        cy,
+        str(fill_style.opacity).encode("ascii"),
+        fill_style.fill_color.to_hex().encode("ascii"),
+        fill_style.fill_color.diffuse(0.75).to_hex().encode("ascii"),
+    )
+
+
+def _linear_gradient_to_svg(
+    reference: bytes,
+    fill_style: LinearGradient,
+    style_out: bytearray,
+    definition_out: bytearray,
+) -> None:
+    """Append the SVG representation of a linear gradient fill style to byte buffers.
+
+    :param reference: The ASCII encoded reference of the fill style.
+    :type reference: bytes
+    :param fill_style: The linear gradient fill style.
+    :type fill_style: LinearGradient
+    :param style_out: The buffer to append the style string to.
+    :type style_out: bytearray
+    :param definition_out: The buffer to append the definition string to.
+    :type definition_out: bytearray
+    """
+    multiplier = 3.0  # Makes linear gradient look better.
+    style_out += _GRADIENT_STYLE_TEMPLATE % (reference, reference)
+    definition_out += _LINEAR_GRADIENT_DEFINITION_TEMPLATE % (
+        reference,
+        fill_style.start.x * multiplier,
+        fill_style.start.y * multiplier,
+        fill_style.end.x * multiplier,
+        fill_style.end.y * multiplier,
+        str(fill_style.opacity).encode("ascii"),
+        fill_style.fill_color.to_hex().encode("ascii"),
+        fill_style.fill_color.diffuse(0.75).to_hex().encode("ascii"),
+    )
+
+
+_FILL_STYLE_TO_SVG: ty.Dict[type, ty.Callable[[bytes, ty.Any, bytearray, bytearray], None]] = {
+    Wire: _wire_to_svg,
+    Solid: _solid_to_svg,
+    RadialGradient: _radial_gradient_to_svg,
+    LinearGradient: _linear_gradient_to_svg,
+}
+
+
 @dataclass
 class Fill:
     """Fill style.
@@ -421,101 +702,45 @@ class Fill:
     :type fill_style: FillStyle
     """
 
+    __slots__ = ("reference", "fill_style")
+
     reference: str
     fill_style: FillStyle
 
+    def to_svg_bytes(self, style_out: bytearray, definition_out: bytearray) -> None:
+        """Append the SVG representation of the fill style to byte buffers.
+
+        :param style_out: The buffer to append the style string to.
+        :type style_out: bytearray
+        :param definition_out: The buffer to append the definition string to. Nothing
+            is appended if the fill style has no definition.
+        :type definition_out: bytearray
+        :raises TypeError: If the fill style is not a FillStyle.
+        """
+        to_svg = _FILL_STYLE_TO_SVG.get(type(self.fill_style))
+
+        if to_svg is None:
+            # Subclasses of the supported fill styles are resolved through their bases.
+            for base in type(self.fill_style).__mro__:
+                if base in _FILL_STYLE_TO_SVG:
+                    to_svg = _FILL_STYLE_TO_SVG[base]
+                    break
+            else:
+                raise TypeError(f"Expected FillStyle, got '{type(self.fill_style)}'")
+
+        to_svg(self.reference.encode("ascii"), self.fill_style, style_out, definition_out)
+
     def to_svg(self) -> ty.Tuple[str, ty.Optional[str]]:
         """Return the SVG representation of the fill style.
 
         :return: The SVG representation of the fill style. The first string is the
             style string, the second string is the definition string.
         :rtype: str, str
-        :raises TypeError: If the fill style is not a FillStyle.
         """
-        if isinstance(self.fill_style, Wire):
-            stroke_color = self.fill_style.stroke_color.to_hex()
-            stroke_width = self.fill_style.stroke_width
-            opacity = self.fill_style.opacity
-
-            style_str = (
-                f".{self.reference}"
-                f"{{stroke:{stroke_color};"
-                f"stroke-width:{stroke_width:.3f}px;"
-                f"stroke-opacity:{opacity};"
-                f"stroke-linecap:round;"
-                f"stroke-linejoin:round;}}"
-            )
-            definition_str = None
-
-            return style_str, definition_str
-
-        elif isinstance(self.fill_style, Solid):
-            fill_color = self.fill_style.fill_color.to_hex()
-            stroke_color = self.fill_style.stroke_color.to_hex()
-            stroke_width = self.fill_style.stroke_width
-            opacity = self.fill_style.opacity
-
-            style_str = (
-                f".{self.reference}"
-                f"{{fill:{fill_color};"
-                f"stroke:{stroke_color};"
-                f"stroke-width:{stroke_width:.3f}px;"
-                f"opacity:{opacity};}}"
-            )
-            definition_str = None
-
-            return style_str, definition_str
-
-        elif isinstance(self.fill_style, RadialGradient):
-            cx = self.fill_style.center.x
-            cy = self.fill_style.center.y
-            r = self.fill_style.radius
-
-            stop_color_offset_a = self.fill_style.fill_color.to_hex()
-            stop_color_offset_b = self.fill_style.fill_color.diffuse(0.75).to_hex()
-
-            style_str = f".{self.reference}{{fill:url(#{self.reference});}}"
-            definition_str = (
-                "<radialGradient"
-                f' id="{self.reference}"'
-                f' cx="{cx:.3f}" cy="{cy:.3f}"'
-                f' r="{r:.3f}" fx="{cx:.3f}" fy="{cy:.3f}"'
-                ' gradientTransform="matrix(1,0,0,1,0,0)"'
-                ' gradientUnits="userSpaceOnUse"'
-                f' opacity="{self.fill_style.opacity}">'
-                f'<stop offset="0.00" stop-color="{stop_color_offset_a}"/>'
-                f'<stop offset="1.00" stop-color="{stop_color_offset_b}"/>'
-                "</radialGradient>"
-            )
-
-            return style_str, definition_str
-
-        elif isinstance(self.fill_style, LinearGradient):
-            multiplier = 3.0  # Makes linear gradient look better.
-            x1 = self.fill_style.start.x * multiplier
-            y1 = self.fill_style.start.y * multiplier
-            x2 = self.fill_style.end.x * multiplier
-            y2 = self.fill_style.end.y * multiplier
-
-            stop_color_offset_a = self.fill_style.fill_color.to_hex()
-            stop_color_offset_b = self.fill_style.fill_color.diffuse(0.75).to_hex()
-
-            style_str = f".{self.reference}{{fill:url(#{self.reference});}}"
-            definition_str = (
-                "<linearGradient"
-                f' id="{self.reference}"'
-                f' x1="{x1:.3f}" y1="{y1:.3f}"'
-                f' x2="{x2:.3f}" y2="{y2:.3f}"'
-                ' gradientUnits="userSpaceOnUse"'
-                ' spreadMethod="reflect"'
-                ' gradientTransform="rotate(90)"'
-                f' opacity="{self.fill_style.opacity}">'
-                f'<stop offset="0.00" stop-color="{stop_color_offset_a}"/>'
-                f'<stop offset="1.00" stop-color="{stop_color_offset_b}"/>'
-                "</linearGradient>"
-            )
+        style_out, definition_out = bytearray(), bytearray()
+        self.to_svg_bytes(style_out, definition_out)
 
-            return style_str, definition_str
+        style_str = style_out.decode("ascii")
+        definition_str = definition_out.decode("ascii") if definition_out else None
 
-        else:
-            raise TypeError(f"Expected FillStyle, got '{type(self.fill_style)}'")
+        return style_str, definition_str
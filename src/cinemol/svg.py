@@ -257,18 +257,19 @@ class Svg:
         header = self.header()
         footer = self.footer()
 
-        styles, definitions = [], []
+        # Fills are written into byte buffers, one per line, and decoded once.
+        styles, definitions = bytearray(), bytearray()
         for fill in self.fills:
-            style, definition = fill.to_svg()
+            num_definition_bytes = len(definitions)
+            fill.to_svg_bytes(styles, definitions)
+            styles += b"\n"
 
-            if style is not None:  # Should never be None.
-                styles.append(style)
+            if len(definitions) != num_definition_bytes:
+                definitions += b"\n"
 
-                if definition is not None:
-                    definitions.append(definition)
-
-        styles_str = "\n".join(styles)
-        definitions_str = "\n".join(definitions)
+        # Drop the newline after the last fill.
+        styles_str = styles[:-1].decode("ascii")
+        definitions_str = definitions[:-1].decode("ascii")
         objects_str = "\n".join([object.to_svg() for object in self.objects])
 
         return (
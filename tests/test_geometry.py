@@ -27,6 +27,8 @@ from cinemol.geometry import (
     gram_schmidt,
     point_is_inside_cylinder,
     point_is_inside_sphere,
+    points_are_inside_cylinder,
+    points_are_inside_sphere,
     same_side_of_plane,
     sign,
     sphere_intersects_with_cylinder,
@@ -222,6 +224,26 @@ class TestGramSchmidt(unittest.TestCase):
         self.assertAlmostEqual(vector_n.dot(vector_w), 0, places=3)
         self.assertAlmostEqual(vector_v.dot(vector_w), 0, places=3)
 
+    def test_gram_schmidt_orthonormal_basis_is_deterministic(self):
+        """Test if the Gram-Schmidt process returns the same orthonormal basis every call."""
+        for vector_n in [Vector3D(0, 0, 1), Vector3D(1, 0, 0), Vector3D(1, 2, 3).normalize()]:
+            vector_v, vector_w = gram_schmidt(vector_n)
+            self.assertAlmostEqual(vector_n.dot(vector_v), 0, places=6)
+            self.assertAlmostEqual(vector_n.dot(vector_w), 0, places=6)
+            self.assertAlmostEqual(vector_v.dot(vector_w), 0, places=6)
+            self.assertAlmostEqual(vector_v.length(), 1, places=6)
+            self.assertAlmostEqual(vector_w.length(), 1, places=6)
+
+            vector_v_again, vector_w_again = gram_schmidt(vector_n)
+            self.assertEqual(
+                (vector_v.x, vector_v.y, vector_v.z),
+                (vector_v_again.x, vector_v_again.y, vector_v_again.z),
+            )
+            self.assertEqual(
+                (vector_w.x, vector_w.y, vector_w.z),
+                (vector_w_again.x, vector_w_again.y, vector_w_again.z),
+            )
+
 
 class TestLine3D(unittest.TestCase):
     """Test the Line3D class."""
@@ -301,6 +323,13 @@ class TestCylinder(unittest.TestCase):
         self.assertEqual(cylinder.radius, radius)
         self.assertEqual(cylinder.cap_type, cap_type)
 
+    def test_cylinder_equality(self):
+        """Test the equality of Cylinder objects."""
+        start, end = Point3D(1, 2, 3), Point3D(4, 5, 6)
+        cylinder = Cylinder(start, end, 7, CylinderCapType.ROUND)
+        self.assertEqual(cylinder, Cylinder(start, end, 7, CylinderCapType.ROUND))
+        self.assertNotEqual(cylinder, Cylinder(start, end, 7, CylinderCapType.FLAT))
+
 
 class TestSameSideOfPlane(unittest.TestCase):
     """Test the same_side_of_plane function."""
@@ -325,6 +354,16 @@ class TestSameSideOfPlane(unittest.TestCase):
         result = same_side_of_plane(plane, point1, point2)
         self.assertFalse(result)
 
+    def test_same_side_of_plane_on_plane(self):
+        """Test same_side_of_plane with a point that lies on the plane."""
+        plane_point = Point3D(0, 0, 0)
+        plane_normal = Vector3D(0, 0, 1)
+        plane = Plane3D(plane_point, plane_normal)
+        point1 = Point3D(1, 1, 0)
+        point2 = Point3D(-1, -1, 1)
+        self.assertFalse(same_side_of_plane(plane, point1, point2))
+        self.assertFalse(same_side_of_plane(plane, point2, point1))
+
 
 class TestDistanceToLine(unittest.TestCase):
     """Test the distance_to_line function."""
@@ -343,6 +382,17 @@ class TestDistanceToLine(unittest.TestCase):
         result = distance_to_line(line, point)
         self.assertAlmostEqual(result, 0.707, places=3)
 
+    def test_distance_to_line_beyond_end_points(self):
+        """Test the distance_to_line function for points beyond the ends of the line."""
+        line = Line3D(Point3D(0, 0, 0), Point3D(1, 0, 0))
+        self.assertAlmostEqual(distance_to_line(line, Point3D(2, 0, 0)), 1.0, places=3)
+        self.assertAlmostEqual(distance_to_line(line, Point3D(-3, 4, 0)), 5.0, places=3)
+
+    def test_distance_to_degenerate_line(self):
+        """Test the distance_to_line function for a line with coinciding end points."""
+        line = Line3D(Point3D(1, 1, 1), Point3D(1, 1, 1))
+        self.assertAlmostEqual(distance_to_line(line, Point3D(1, 4, 5)), 5.0, places=3)
+
 
 class TestGetPerpendicularLines(unittest.TestCase):
     """Test the get_perpendicular_lines function."""
@@ -495,6 +545,16 @@ class TestGetPointsOnSurfaceSphere(unittest.TestCase):
         for point in result:
             self.assertAlmostEqual(point.calculate_distance(sphere.center), sphere.radius, places=3)
 
+    def test_points_on_surface_sphere_filter_for_pov(self):
+        """Test if the get_points_on_surface_sphere function only returns visible points."""
+        sphere = Sphere(Point3D(1, 2, 3), 1)
+        result = get_points_on_surface_sphere(sphere, 10, 10, filter_for_pov=True)
+        unfiltered = get_points_on_surface_sphere(sphere, 10, 10, filter_for_pov=False)
+        self.assertEqual(len(unfiltered), 11 * 11)
+        self.assertTrue(0 < len(result) < len(unfiltered))
+        for point in result:
+            self.assertTrue(point.z >= sphere.center.z)
+
 
 class TestGetPointsOnSurfaceCap(unittest.TestCase):
     """Test the get_points_on_surface_cap function."""
@@ -510,6 +570,26 @@ class TestGetPointsOnSurfaceCap(unittest.TestCase):
             self.assertTrue(round(point.calculate_distance(circle.center), 5) <= circle.radius)
             self.assertAlmostEqual(point.z, 0, places=3)
 
+    def test_points_on_surface_flat_cap_with_basis(self):
+        """Test if passing the basis of the cap gives the same points as calculating it."""
+        circle = Circle3D(Point3D(1, 2, 3), 1, Vector3D(1, 1, 0).normalize())
+        cap_type = CylinderCapType.FLAT
+        expected = get_points_on_surface_cap(
+            cap_type, circle.center, circle.radius, circle.normal, Point3D(0, 0, 0), 10
+        )
+        result = get_points_on_surface_cap(
+            cap_type,
+            circle.center,
+            circle.radius,
+            circle.normal,
+            Point3D(0, 0, 0),
+            10,
+            basis=gram_schmidt(circle.normal),
+        )
+        self.assertEqual(len(result), len(expected))
+        for point, expected_point in zip(result, expected):
+            self.assertAlmostEqual(point.calculate_distance(expected_point), 0.0, places=6)
+
     def test_points_on_surface_round_cap_returns_points_on_surface(self):
         """Test if the get_points_on_surface_cap function returns points on the surface."""
         circle = Circle3D(Point3D(0, 0, 0), 1, Vector3D(0, 0, 1))
@@ -582,6 +662,55 @@ class TestPointIsInsideCylinder(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestPointsAreInsideSphere(unittest.TestCase):
+    """Test the points_are_inside_sphere function."""
+
+    def test_points_are_inside_sphere_matches_point_is_inside_sphere(self):
+        """Test if points_are_inside_sphere agrees with point_is_inside_sphere for every point."""
+        sphere = Sphere(Point3D(0, 0, 0), 1)
+        points = [Point3D(0, 0, 0.5), Point3D(0, 0, 1.5), Point3D(0.6, 0.6, 0.6), Point3D(0, 0, 0)]
+        result = points_are_inside_sphere(sphere, points)
+        self.assertEqual(result, [point_is_inside_sphere(sphere, point) for point in points])
+        self.assertEqual(result, [True, False, False, True])
+
+
+class TestPointsAreInsideCylinder(unittest.TestCase):
+    """Test the points_are_inside_cylinder function."""
+
+    def test_points_are_inside_cylinder_matches_point_is_inside_cylinder(self):
+        """Test if points_are_inside_cylinder agrees with point_is_inside_cylinder for every point."""
+        points = [
+            Point3D(0, 0, 0.5),
+            Point3D(0, 0, 1.5),
+            Point3D(0, 0, -0.5),
+            Point3D(0.5, 0.5, 0.5),
+            Point3D(1.5, 0, 0.5),
+            Point3D(0.2, 0.2, 1.2),
+        ]
+        for cap_type in CylinderCapType:
+            cylinder = Cylinder(Point3D(0, 0, 0), Point3D(0, 0, 1), 1, cap_type)
+            result = points_are_inside_cylinder(cylinder, points)
+            expected = [point_is_inside_cylinder(cylinder, point) for point in points]
+            self.assertEqual(result, expected)
+
+    def test_points_are_inside_cylinder_after_moving_end_point(self):
+        """Test if both inside tests follow an end point that is moved in place."""
+        cylinder = Cylinder(Point3D(0, 0, 0), Point3D(0, 0, 1), 0.1, CylinderCapType.FLAT)
+        point = Point3D(0.5, 0, 0)
+        self.assertFalse(point_is_inside_cylinder(cylinder, point))
+        cylinder.end.x, cylinder.end.z = 1.0, 0.0
+        self.assertTrue(point_is_inside_cylinder(cylinder, point))
+        self.assertEqual(points_are_inside_cylinder(cylinder, [point]), [True])
+
+    def test_unknown_cap_type_raises(self):
+        """Test if an unknown cap type raises a ValueError."""
+        cylinder = Cylinder(Point3D(0, 0, 0), Point3D(0, 0, 1), 1, "unknown")
+        with self.assertRaises(ValueError):
+            point_is_inside_cylinder(cylinder, Point3D(0, 0, 0.5))
+        with self.assertRaises(ValueError):
+            points_are_inside_cylinder(cylinder, [Point3D(0, 0, 0.5)])
+
+
 class TestSphereIntersectsWithSphere(unittest.TestCase):
     """Test the sphere_intersects_with_sphere function."""
 
@@ -1,3 +1,170 @@
 # -*- coding: utf-8 -*-
 
 """Contains unit tests for the cinemol.style module."""
+
+import unittest
+
+from cinemol.geometry import Point2D
+from cinemol.style import (
+    Color,
+    CoreyPaulingKoltungAtomColor,
+    Fill,
+    FillStyle,
+    PubChemAtomRadius,
+    RadialGradient,
+    Solid,
+    Wire,
+)
+
+
+class TestColor(unittest.TestCase):
+    """Test the Color class."""
+
+    def test_color_creation(self):
+        """Test the creation of a Color object."""
+        color = Color(1, 2, 3)
+        self.assertEqual((color.r, color.g, color.b), (1, 2, 3))
+
+    def test_color_creation_clamps_components(self):
+        """Test if components outside of the 0-255 range are clamped."""
+        color = Color(-10, 128, 300)
+        self.assertEqual((color.r, color.g, color.b), (0, 128, 255))
+
+    def test_color_creation_with_float_raises(self):
+        """Test if creating a color with non-integer components raises an exception."""
+        with self.assertRaises(TypeError):
+            Color(1.0, 2, 3)
+
+    def test_color_to_hex(self):
+        """Test the conversion of a Color object to a hex string."""
+        self.assertEqual(Color(255, 165, 0).to_hex(), "#ffa500")
+
+    def test_color_to_str(self):
+        """Test the string representation of a Color object."""
+        self.assertEqual(str(Color(255, 165, 0)), "rgb(255,165,0)")
+
+    def test_color_hash(self):
+        """Test if equal Color objects have equal hashes."""
+        self.assertEqual(hash(Color(1, 2, 3)), hash(Color(1, 2, 3)))
+        self.assertEqual(len({Color(1, 2, 3), Color(1, 2, 3), Color(3, 2, 1)}), 2)
+
+    def test_color_diffuse(self):
+        """Test the diffusion of a Color object."""
+        for r, g, b in [(255, 255, 255), (80, 80, 80), (255, 165, 0), (170, 51, 106)]:
+            for alpha in [0.0, 0.25, 0.5, 0.75, 1.0]:
+                color = Color(r, g, b).diffuse(alpha)
+                expected = (int(r * alpha), int(g * alpha), int(b * alpha))
+                self.assertEqual((color.r, color.g, color.b), expected)
+
+    def test_color_diffuse_is_quantized(self):
+        """Test if the diffusion factor of a Color object is quantized to 1/256."""
+        self.assertEqual(Color(255, 255, 255).diffuse(0.3), Color(75, 75, 75))
+        for r, g, b in [(255, 255, 255), (80, 80, 80), (255, 165, 0), (170, 51, 106)]:
+            for alpha in [0.1, 0.3, 0.6, 0.9]:
+                color = Color(r, g, b).diffuse(alpha)
+                factor = int(alpha * 256)
+                expected = tuple(int(c * factor / 256) for c in (r, g, b))
+                self.assertEqual((color.r, color.g, color.b), expected)
+
+    def test_color_diffuse_with_int_raises(self):
+        """Test if diffusing a color with a non-float alpha raises an exception."""
+        with self.assertRaises(TypeError):
+            Color(1, 2, 3).diffuse(1)
+
+
+class TestCoreyPaulingKoltungAtomColor(unittest.TestCase):
+    """Test the CoreyPaulingKoltungAtomColor class."""
+
+    def test_get_color(self):
+        """Test the color lookup of known atom symbols."""
+        scheme = CoreyPaulingKoltungAtomColor()
+        self.assertEqual(scheme.get_color("C"), Color(80, 80, 80))
+        self.assertEqual(scheme.get_color("O"), Color(255, 0, 0))
+        self.assertEqual(scheme.get_color("I"), Color(148, 0, 211))
+
+    def test_get_color_unknown_symbol(self):
+        """Test the color lookup of an unknown atom symbol."""
+        scheme = CoreyPaulingKoltungAtomColor()
+        self.assertEqual(scheme.get_color("Xx"), Color(255, 192, 203))
+
+    def test_atom_color_class_attributes(self):
+        """Test if the per-element class attributes agree with the color lookup."""
+        scheme = CoreyPaulingKoltungAtomColor()
+        self.assertEqual(CoreyPaulingKoltungAtomColor.C, scheme.get_color("C"))
+        self.assertEqual(CoreyPaulingKoltungAtomColor.Oxygen, scheme.get_color("O"))
+        self.assertEqual(CoreyPaulingKoltungAtomColor.Iodine, scheme.get_color("I"))
+
+
+class TestPubChemAtomRadius(unittest.TestCase):
+    """Test the PubChemAtomRadius class."""
+
+    def test_to_angstrom(self):
+        """Test the radius lookup of known atom symbols."""
+        scheme = PubChemAtomRadius()
+        self.assertAlmostEqual(scheme.to_angstrom("H"), 1.20)
+        self.assertAlmostEqual(scheme.to_angstrom("O"), 1.52)
+        self.assertAlmostEqual(scheme.to_angstrom("I"), 1.98)
+
+    def test_to_angstrom_unknown_symbol(self):
+        """Test the radius lookup of an unknown atom symbol."""
+        scheme = PubChemAtomRadius()
+        self.assertAlmostEqual(scheme.to_angstrom("Xx"), 1.70)
+
+    def test_atom_radius_class_attributes(self):
+        """Test if the per-element class attributes agree with the radius lookup."""
+        scheme = PubChemAtomRadius()
+        self.assertAlmostEqual(PubChemAtomRadius.H * 0.01, scheme.to_angstrom("H"))
+        self.assertAlmostEqual(PubChemAtomRadius.Oxygen * 0.01, scheme.to_angstrom("O"))
+        self.assertAlmostEqual(PubChemAtomRadius.Iodine * 0.01, scheme.to_angstrom("I"))
+
+
+class TestFill(unittest.TestCase):
+    """Test the Fill class."""
+
+    def test_wire_fill_to_svg(self):
+        """Test the SVG representation of a wire fill."""
+        fill = Fill("node-0", Wire(Color(255, 0, 0), 0.05, 1.0))
+        style_str, definition_str = fill.to_svg()
+        self.assertEqual(
+            style_str,
+            ".node-0{stroke:#ff0000;stroke-width:0.050px;stroke-opacity:1.0;"
+            "stroke-linecap:round;stroke-linejoin:round;}",
+        )
+        self.assertIsNone(definition_str)
+
+    def test_solid_fill_to_svg(self):
+        """Test the SVG representation of a solid fill."""
+        fill = Fill("node-0", Solid(Color(255, 0, 0), Color(0, 0, 0), 0.05, 1.0))
+        style_str, definition_str = fill.to_svg()
+        self.assertEqual(
+            style_str, ".node-0{fill:#ff0000;stroke:#000000;stroke-width:0.050px;opacity:1.0;}"
+        )
+        self.assertIsNone(definition_str)
+
+    def test_radial_gradient_fill_to_svg(self):
+        """Test the SVG representation of a radial gradient fill."""
+        fill = Fill("node-0", RadialGradient(Color(255, 0, 0), Point2D(1, 2), 3, 1.0))
+        style_str, definition_str = fill.to_svg()
+        self.assertEqual(style_str, ".node-0{fill:url(#node-0);}")
+        self.assertEqual(
+            definition_str,
+            '<radialGradient id="node-0" cx="1.000" cy="2.000" r="3.000" fx="1.000" fy="2.000"'
+            ' gradientTransform="matrix(1,0,0,1,0,0)" gradientUnits="userSpaceOnUse"'
+            ' opacity="1.0"><stop offset="0.00" stop-color="#ff0000"/>'
+            '<stop offset="1.00" stop-color="#bf0000"/></radialGradient>',
+        )
+
+    def test_fill_to_svg_bytes_appends_to_buffers(self):
+        """Test if to_svg_bytes appends the same SVG as to_svg to the given buffers."""
+        fill = Fill("node-1", RadialGradient(Color(255, 0, 0), Point2D(1, 2), 3, 1.0))
+        style_out, definition_out = bytearray(b"a"), bytearray(b"b")
+        fill.to_svg_bytes(style_out, definition_out)
+        style_str, definition_str = fill.to_svg()
+        self.assertEqual(style_out, b"a" + style_str.encode())
+        self.assertEqual(definition_out, b"b" + definition_str.encode())
+
+    def test_unknown_fill_style_to_svg_raises(self):
+        """Test if an unsupported fill style raises an exception."""
+        fill = Fill("node-0", FillStyle())
+        with self.assertRaises(TypeError):
+            fill.to_svg()